@@ -1,38 +1,222 @@
+import os
+import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+from numba import njit
 import streamlit as st
 import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
 from datetime import datetime
 
 # --- Load Data ---
+# cairo.parquet is produced once from the raw CSV by csv_to_parquet.py;
+# the processed frame is kept in cairo.feather (uncompressed Arrow IPC)
+# so restarts memory-map it instead of rebuilding. It is rebuilt whenever
+# the Parquet file or this script is newer. Returns the frame and the
+# latest date as a display string.
 @st.cache_data
 def load_data():
-    df = pd.read_csv("Cairo-Weather-clean (1).csv")
-    df = df.dropna(axis=1, how='all')
+    if (os.path.exists("cairo.feather")
+            and os.path.getmtime("cairo.feather") >= max(os.path.getmtime("cairo.parquet"),
+                                                         os.path.getmtime(__file__))):
+        with pa.memory_map("cairo.feather") as source:
+            df = pa.ipc.open_file(source).read_all().to_pandas()
+        return df, df['time'].max().strftime('%Y-%m-%d')
     
-    # Convert date columns
-    df['time'] = pd.to_datetime(df['time'])
-    if 'sunrise_iso8601' in df.columns:
-        df['sunrise_iso8601'] = pd.to_datetime(df['sunrise_iso8601'])
-    if 'sunset_iso8601' in df.columns:
-        df['sunset_iso8601'] = pd.to_datetime(df['sunset_iso8601'])
+    # Only the dashboard metrics are read; the other weather columns are unused
+    metrics = [
+        'temperature_2m_mean_°C',
+        'relative_humidity_2m_mean_%',
+        'wind_speed_10m_mean_km/h',
+        'rain_sum_mm'
+    ]
+    df = pl.read_parquet("cairo.parquet", columns=['time'] + metrics).sort('time')
+    
+    # Narrow the dashboard metrics to float32
+    df = df.with_columns(pl.col(metrics).cast(pl.Float32))
     
     # Extract time features
-    df['month'] = df['time'].dt.month
-    df['year'] = df['time'].dt.year
-    df['day_of_week'] = df['time'].dt.dayofweek
-    df['date'] = df['time'].dt.date
+    df = df.with_columns(
+        month=pl.col('time').dt.month().cast(pl.Int8),
+        year=pl.col('time').dt.year().cast(pl.Int16),
+        day_of_week=(pl.col('time').dt.weekday() - 1).cast(pl.Int8),
+        hour=pl.col('time').dt.hour().cast(pl.Int8),
+        day_of_week_name=pl.col('time').dt.strftime('%A').cast(pl.Categorical),
+        month_name=pl.col('time').dt.strftime('%B').cast(pl.Categorical),
+    ).to_pandas()
+    
+    # Add seasons (Dec-Feb Winter, Mar-May Spring, Jun-Aug Summer, Sep-Nov Autumn)
+    m = df['month'].to_numpy()
+    seasons = ['Winter', 'Spring', 'Summer', 'Autumn']
+    df['season'] = pd.Categorical(
+        np.select([m <= 2, m <= 5, m <= 8, m <= 11], seasons, default='Winter'),
+        categories=seasons
+    )
     
-    # Add seasons
-    def get_season(month):
-        if month in [12, 1, 2]: return 'Winter'
-        elif month in [3, 4, 5]: return 'Spring'
-        elif month in [6, 7, 8]: return 'Summer'
-        else: return 'Autumn'
-    df['season'] = df['month'].apply(get_season)
+    df.to_feather("cairo.feather", compression='uncompressed')
+    return df, df['time'].max().strftime('%Y-%m-%d')
+
+# --- Downsampling ---
+# Largest-Triangle-Three-Buckets: keeps the visual shape of a series
+# while handing at most n_out points to Plotly
+def lttb_indices(x, y, n_out):
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
     
-    return df
+    x = x.astype('float64')
+    y = y.astype('float64')
+    edges = np.linspace(1, n - 1, n_out - 1).astype('int64')
+    idx = np.empty(n_out, dtype='int64')
+    idx[0], idx[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + area.argmax()
+        idx[i + 1] = a
+    return idx
+
+# --- Wet/Dry Months ---
+# Single pass for the month rain totals, then one pass to flag each row
+# whose month total is above the mean of the months present
+@njit(cache=True)
+def monthly_wetdry(month, rain):
+    sums = np.zeros(13)
+    seen = np.zeros(13, np.bool_)
+    for i in range(len(month)):
+        sums[month[i]] += rain[i]
+        seen[month[i]] = True
+    
+    total = 0.0
+    n = 0
+    for m in range(1, 13):
+        if seen[m]:
+            total += sums[m]
+            n += 1
+    mean = total / n if n else 0.0
+    
+    wet = np.empty(len(month), np.bool_)
+    for i in range(len(month)):
+        wet[i] = sums[month[i]] > mean
+    return wet, sums
+
+# --- Cached Aggregations ---
+# Each aggregation is keyed on the selected date bounds (and metric) only;
+# the leading underscore keeps Streamlit from hashing the filtered frame.
+# Group-bys and pivots run on a Polars copy of the filtered frame.
+@st.cache_data
+def key_metrics(_df_filtered, lo, hi):
+    return {
+        'avg_temp': _df_filtered['temperature_2m_mean_°C'].mean(),
+        'max_temp': _df_filtered['temperature_2m_mean_°C'].max(),
+        'avg_humidity': _df_filtered['relative_humidity_2m_mean_%'].mean(),
+        'total_rain': _df_filtered['rain_sum_mm'].sum()
+    }
+
+@st.cache_data
+def month_counts(_pl_df, lo, hi):
+    counts = _pl_df.group_by('month').len(name='count').to_pandas()
+    return counts.set_index('month')['count'].reindex(range(1, 13), fill_value=0)
+
+@st.cache_data
+def season_distribution(_pl_df, lo, hi):
+    # Seasons are fixed groups of months, so sum the 12 monthly counts
+    counts = month_counts(_pl_df, lo, hi)
+    season_months = {
+        'Winter': [12, 1, 2],
+        'Spring': [3, 4, 5],
+        'Summer': [6, 7, 8],
+        'Autumn': [9, 10, 11]
+    }
+    return pd.DataFrame({
+        'season': list(season_months),
+        'count': [counts[months].sum() for months in season_months.values()]
+    })
+
+@st.cache_data
+def monthly_average(_pl_df, lo, hi, metric):
+    return _pl_df.group_by('month').agg(pl.col(metric).mean()).sort('month').to_pandas()
+
+@st.cache_data
+def humidity_by_month_type(_pl_df, lo, hi):
+    wet, _ = monthly_wetdry(_pl_df['month'].to_numpy(), _pl_df['rain_sum_mm'].to_numpy())
+    humidity = _pl_df['relative_humidity_2m_mean_%'].to_numpy()
+    rows = [(label, humidity[mask].mean())
+            for label, mask in (('Dry', ~wet), ('Wet', wet)) if mask.any()]
+    humidity_avg = pd.DataFrame(rows, columns=['MonthType', 'relative_humidity_2m_mean_%'])
+    humidity_avg['MonthType'] = pd.Categorical(humidity_avg['MonthType'], categories=['Dry', 'Wet'])
+    return humidity_avg
 
-df = load_data()
+@st.cache_data
+def monthly_rainfall_total(_pl_df, lo, hi):
+    return _pl_df.group_by('month').agg(pl.col('rain_sum_mm').sum()).sort('month').to_pandas()
+
+@st.cache_data
+def downsampled_series(_df_filtered, lo, hi, metric, n_out=2000):
+    idx = lttb_indices(_df_filtered['time'].to_numpy().astype('int64'),
+                       _df_filtered[metric].to_numpy(), n_out)
+    return _df_filtered[['time', metric]].iloc[idx]
+
+# The seasonal wind charts cover the full dataset, so they are built once
+@st.cache_data
+def season_wind_sample(_df, per_season=2000):
+    # Stratified sample: up to per_season random rows from each season
+    return (_df[['season', 'wind_speed_10m_mean_km/h']]
+            .sample(frac=1, random_state=0)
+            .groupby('season', observed=True).head(per_season))
+
+@st.cache_data
+def season_wind_temperature(_df):
+    return (_df.groupby('season', observed=True)
+            [['wind_speed_10m_mean_km/h', 'temperature_2m_mean_°C']].mean().reset_index())
+
+@st.cache_data
+def temperature_cube(_pl_df, lo, hi):
+    # One pass over the temperatures; both heatmaps are reshaped from this.
+    # Sums and counts (not means) so re-aggregation stays exact.
+    temp = pl.col('temperature_2m_mean_°C')
+    return (_pl_df
+            .group_by(['hour', 'day_of_week_name', 'month_name'])
+            .agg(temp_sum=temp.sum(), temp_count=temp.count()))
+
+@st.cache_data
+def temperature_heatmap(_cube, lo, hi, index, columns, column_order):
+    # Returns a contiguous float32 matrix plus its x/y labels for px.imshow
+    pivot = (_cube
+             .group_by([index, columns])
+             .agg((pl.col('temp_sum').sum() / pl.col('temp_count').sum())
+                  .alias('temperature_2m_mean_°C'))
+             .pivot(on=columns, index=index, values='temperature_2m_mean_°C')
+             .sort(index).to_pandas().set_index(index))[column_order]
+    return np.ascontiguousarray(pivot.to_numpy(dtype=np.float32)), column_order, pivot.index.tolist()
+
+# --- Plotly Template ---
+# Shared 'cairo' template: Set1 for categorical traces, Viridis for
+# continuous colour, on top of the stock plotly layout
+@st.cache_resource
+def register_template():
+    template = go.layout.Template(pio.templates['plotly'])
+    template.layout.colorway = px.colors.qualitative.Set1
+    template.layout.colorscale.sequential = px.colors.sequential.Viridis
+    pio.templates['cairo'] = template
+
+register_template()
+
+# Arrow copy of the data, shared across sessions; slices of it are zero-copy
+@st.cache_resource
+def load_table():
+    return pa.Table.from_pandas(load_data()[0], preserve_index=False)
+
+df, LAST_UPDATE = load_data()
+table = load_table()
 
 # --- Page Config ---
 st.set_page_config(page_title="🌦️ Cairo Weather Dashboard", layout="wide")
@@ -41,7 +225,7 @@ st.markdown("""
 Welcome to the **Cairo Weather Dashboard**!  
 Explore historical weather trends for Cairo, Egypt.  
 *Data last updated: {}*
-""".format(df['time'].max().strftime('%Y-%m-%d')))
+""".format(LAST_UPDATE))
 
 # --- Sidebar ---
 st.sidebar.title("Cairo Weather Dashboard")
@@ -64,199 +248,219 @@ selected_metric = st.sidebar.selectbox(
     index=0
 )
 
-# Filter Data
+# Filter Data (time is sorted, so the range is a contiguous slice)
 if len(date_range) == 2:
-    df_filtered = df[(df['date'] >= date_range[0]) & (df['date'] <= date_range[1])]
+    lo, hi = date_range
+    i0, i1 = df['time'].values.searchsorted([
+        pd.Timestamp(lo).to_datetime64(),
+        (pd.Timestamp(hi) + pd.Timedelta(days=1)).to_datetime64()
+    ])
 else:
-    df_filtered = df.copy()
-
-# --- Key Metrics ---
-st.subheader("📊 Key Weather Metrics")
-col1, col2, col3, col4 = st.columns(4)
-with col1:
-    st.metric("Avg Temperature", f"{df_filtered['temperature_2m_mean_°C'].mean():.1f}°C")
-with col2:
-    st.metric("Max Temperature", f"{df_filtered['temperature_2m_mean_°C'].max():.1f}°C")
-with col3:
-    st.metric("Avg Humidity", f"{df_filtered['relative_humidity_2m_mean_%'].mean():.1f}%")
-with col4:
-    st.metric("Total Rainfall", f"{df_filtered['rain_sum_mm'].sum():.1f} mm")
-
-# --- Recent Forecast ---
-st.subheader("📅 Recent Weather Conditions")
-st.dataframe(
-    df_filtered[['time', 'temperature_2m_mean_°C', 'relative_humidity_2m_mean_%', 
-                'wind_speed_10m_mean_km/h', 'rain_sum_mm']].tail(5).sort_index(ascending=False),
-    column_config={
-        "time": "Date",
-        "temperature_2m_mean_°C": "Temp (°C)",
-        "relative_humidity_2m_mean_%": "Humidity (%)",
-        "wind_speed_10m_mean_km/h": "Wind (km/h)",
-        "rain_sum_mm": "Rain (mm)"
-    },
-    hide_index=True
-)
+    lo, hi = None, None
+    i0, i1 = 0, len(df)
+df_filtered = df.iloc[i0:i1]
 
-# --- Charts Section ---
-st.subheader("📈 Weather Trends Analysis")
-
-# Row 1: Season Distribution and Monthly Averages
-col1, col2 = st.columns(2)
-with col1:
-    st.markdown("#### Season Distribution")
-    season_counts = df_filtered['season'].value_counts().reset_index()
-    fig_pie = px.pie(
-        season_counts,
-        names='season',
-        values='count',
-        color_discrete_sequence=px.colors.sequential.Aggrnyl,
-        hole=0.4
-    )
-    st.plotly_chart(fig_pie, use_container_width=True)
-
-with col2:
-    st.markdown(f"#### Monthly {selected_metric.replace('_', ' ').title()}")
-    monthly_avg = df_filtered.groupby('month')[selected_metric].mean().reset_index()
-    fig_bar = px.bar(
-        monthly_avg,
-        x='month',
-        y=selected_metric,
-        text=selected_metric,
-        color=selected_metric,
-        color_continuous_scale=px.colors.sequential.Sunset
+# The Polars aggregations read only these columns, straight from the Arrow slice
+pl_df = pl.from_arrow(table.slice(i0, i1 - i0).select([
+    'month', 'season', 'hour', 'day_of_week_name', 'month_name',
+    'temperature_2m_mean_°C', 'relative_humidity_2m_mean_%',
+    'wind_speed_10m_mean_km/h', 'rain_sum_mm'
+]))
+
+# --- Dashboard Sections ---
+# Only the selected tab is built, and switching tabs reruns just this fragment
+@st.fragment
+def dashboard_sections(df, df_filtered, pl_df, lo, hi, selected_metric):
+    tab_kpi, tab_trends, tab_extra, tab_heat = st.tabs(
+        ["📊 Key Metrics", "📈 Trends", "📊 Extra Insights", "🌡️ Temperature Patterns"],
+        key='section',
+        on_change='rerun'
     )
-    fig_bar.update_traces(texttemplate='%{text:.1f}', textposition='outside')
-    fig_bar.update_layout(yaxis=dict(visible=False))
-    st.plotly_chart(fig_bar, use_container_width=True)
-
-# Row 2: Time Series
-st.markdown(f"#### {selected_metric.replace('_', ' ').title()} Over Time")
-fig_line = px.line(
-    df_filtered,
-    x='time',
-    y=selected_metric,
-    markers=True,
-    color_discrete_sequence=px.colors.qualitative.Set1
-)
-st.plotly_chart(fig_line, use_container_width=True)
+    
+    if tab_kpi.open:
+        with tab_kpi:
+            # --- Key Metrics ---
+            st.subheader("📊 Key Weather Metrics")
+            metrics = key_metrics(df_filtered, lo, hi)
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Avg Temperature", f"{metrics['avg_temp']:.1f}°C")
+            with col2:
+                st.metric("Max Temperature", f"{metrics['max_temp']:.1f}°C")
+            with col3:
+                st.metric("Avg Humidity", f"{metrics['avg_humidity']:.1f}%")
+            with col4:
+                st.metric("Total Rainfall", f"{metrics['total_rain']:.1f} mm")
 
+            # --- Recent Forecast ---
+            st.subheader("📅 Recent Weather Conditions")
+            st.dataframe(
+                df_filtered[['time', 'temperature_2m_mean_°C', 'relative_humidity_2m_mean_%', 
+                            'wind_speed_10m_mean_km/h', 'rain_sum_mm']].tail(5).sort_index(ascending=False),
+                column_config={
+                    "time": "Date",
+                    "temperature_2m_mean_°C": "Temp (°C)",
+                    "relative_humidity_2m_mean_%": "Humidity (%)",
+                    "wind_speed_10m_mean_km/h": "Wind (km/h)",
+                    "rain_sum_mm": "Rain (mm)"
+                },
+                hide_index=True
+            )
 
-# --- Additional Charts Section ---
-st.subheader("📊 Extra Weather Insights")
+    if tab_trends.open:
+        with tab_trends:
+            # --- Charts Section ---
+            st.subheader("📈 Weather Trends Analysis")
 
-# 1️⃣ Average Humidity in Wet vs Dry Months
-st.markdown("#### Average Humidity in Wet vs Dry Months")
-monthly_rain = df_filtered.groupby('month')['rain_sum_mm'].sum()
-wet_months = monthly_rain[monthly_rain > monthly_rain.mean()].index
-df_filtered['MonthType'] = df_filtered['month'].apply(lambda x: 'Wet' if x in wet_months else 'Dry')
+            # Row 1: Season Distribution and Monthly Averages
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("#### Season Distribution")
+                season_counts = season_distribution(pl_df, lo, hi)
+                fig_pie = px.pie(
+                    season_counts,
+                    names='season',
+                    values='count',
+                    color_discrete_sequence=px.colors.sequential.Aggrnyl,
+                    hole=0.4,
+                    template='cairo'
+                )
+                st.plotly_chart(fig_pie, use_container_width=True)
 
-humidity_avg = df_filtered.groupby('MonthType')['relative_humidity_2m_mean_%'].mean().reset_index()
-fig_humidity = px.bar(
-    humidity_avg,
-    x='MonthType',
-    y='relative_humidity_2m_mean_%',
-    color='MonthType',
-    color_discrete_sequence=px.colors.sequential.Aggrnyl
-)
-st.plotly_chart(fig_humidity, use_container_width=True)
-
-
-# 3️⃣ Monthly Rainfall Trend
-st.markdown("#### Monthly Rainfall Trend")
-monthly_rainfall = df_filtered.groupby('month')['rain_sum_mm'].sum().reset_index()
-fig_rain = px.line(
-    monthly_rainfall,
-    x='month',
-    y='rain_sum_mm',
-    markers=True,
-    color_discrete_sequence=px.colors.qualitative.Set1
-)
-st.plotly_chart(fig_rain, use_container_width=True)
-
-# --- 6. Seasons vs Wind Speed ---
-st.subheader("Seasons vs Wind Speed")
-fig6 = px.violin(df, x='season', y='wind_speed_10m_mean_km/h',
-                 color='season',
-                 box=True,
-                 color_discrete_sequence=px.colors.qualitative.Set1)
-st.plotly_chart(fig6, use_container_width=True)
-
-
-# --- Bar Chart: Average Wind Speed vs Temperature by Season ---
-st.subheader(" Average Wind Speed vs Temperature")
-fig_bar = px.bar(
-    df,
-    x='season',
-    y='wind_speed_10m_mean_km/h',
-    color='temperature_2m_mean_°C',
-    barmode='group',
-    color_continuous_scale='Viridis'
-)
-st.plotly_chart(fig_bar, use_container_width=True)
+            with col2:
+                st.markdown(f"#### Monthly {selected_metric.replace('_', ' ').title()}")
+                monthly_avg = monthly_average(pl_df, lo, hi, selected_metric)
+                fig_bar = px.bar(
+                    monthly_avg,
+                    x='month',
+                    y=selected_metric,
+                    text=selected_metric,
+                    color=selected_metric,
+                    color_continuous_scale=px.colors.sequential.Sunset,
+                    template='cairo'
+                )
+                fig_bar.update_traces(texttemplate='%{text:.1f}', textposition='outside')
+                fig_bar.update_layout(yaxis=dict(visible=False))
+                st.plotly_chart(fig_bar, use_container_width=True)
 
+            # Row 2: Time Series
+            st.markdown(f"#### {selected_metric.replace('_', ' ').title()} Over Time")
+            series = downsampled_series(df_filtered, lo, hi, selected_metric)
+            fig_line = go.Figure(go.Scattergl(
+                x=series['time'],
+                y=series[selected_metric],
+                mode='lines+markers' if len(series) < 500 else 'lines'
+            ))
+            fig_line.update_layout(template='cairo', xaxis_title='time', yaxis_title=selected_metric,
+                                   uirevision='static')
+            st.plotly_chart(fig_line, use_container_width=True)
 
-# ---  Cairo Temperature  ---
+    if tab_extra.open:
+        with tab_extra:
+            # --- Additional Charts Section ---
+            st.subheader("📊 Extra Weather Insights")
 
-st.subheader("🌡️ Temperature Patterns by Time of Day")
+            # 1️⃣ Average Humidity in Wet vs Dry Months
+            st.markdown("#### Average Humidity in Wet vs Dry Months")
+            humidity_avg = humidity_by_month_type(pl_df, lo, hi)
+            fig_humidity = px.bar(
+                humidity_avg,
+                x='MonthType',
+                y='relative_humidity_2m_mean_%',
+                color='MonthType',
+                color_discrete_sequence=px.colors.sequential.Aggrnyl,
+                template='cairo'
+            )
+            st.plotly_chart(fig_humidity, use_container_width=True)
 
-# Create time features for heatmap
-df_filtered['hour'] = df_filtered['time'].dt.hour
-df_filtered['day_of_week'] = df_filtered['time'].dt.day_name()
-df_filtered['month_name'] = df_filtered['time'].dt.month_name()
+            # 3️⃣ Monthly Rainfall Trend
+            st.markdown("#### Monthly Rainfall Trend")
+            monthly_rainfall = monthly_rainfall_total(pl_df, lo, hi)
+            fig_rain = go.Figure(go.Scattergl(
+                x=monthly_rainfall['month'],
+                y=monthly_rainfall['rain_sum_mm'],
+                mode='lines'
+            ))
+            fig_rain.update_layout(template='cairo', xaxis_title='month', yaxis_title='rain_sum_mm',
+                                   uirevision='static')
+            st.plotly_chart(fig_rain, use_container_width=True)
 
-# Create tabs for different temporal views
-tab1, tab2 = st.tabs(["By Hour of Day", "By Day of Week"])
+            # --- 6. Seasons vs Wind Speed ---
+            st.subheader("Seasons vs Wind Speed")
+            fig6 = px.violin(season_wind_sample(df), x='season', y='wind_speed_10m_mean_km/h',
+                             color='season',
+                             box=True,
+                             template='cairo')
+            st.plotly_chart(fig6, use_container_width=True)
 
-with tab1:
-    # Hourly heatmap
-    heatmap_data = df_filtered.pivot_table(
-        index='hour',
-        columns='day_of_week',
-        values='temperature_2m_mean_°C',
-        aggfunc='mean'
-    )
-    
-    # Reorder columns to start with Monday
-    days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    heatmap_data = heatmap_data[days_order]
-    
-    fig = px.imshow(
-        heatmap_data,
-        labels=dict(x="Day of Week", y="Hour of Day", color="Temperature (°C)"),
-        color_continuous_scale="thermal",
-        title="Average Temperature by Hour and Day"
-    )
-    fig.update_xaxes(side="top")
-    st.plotly_chart(fig, use_container_width=True)
-
-with tab2:
-    # Daily heatmap
-    heatmap_data = df_filtered.pivot_table(
-        index='day_of_week',
-        columns='month_name',
-        values='temperature_2m_mean_°C',
-        aggfunc='mean'
-    )
-    
-    # Reorder for logical display
-    months_order = ['January', 'February', 'March', 'April', 'May', 'June', 
-                   'July', 'August', 'September', 'October', 'November', 'December']
-    heatmap_data = heatmap_data[months_order]
-    
-    fig = px.imshow(
-        heatmap_data,
-        labels=dict(x="Month", y="Day of Week", color="Temperature (°C)"),
-        color_continuous_scale="thermal",
-        title="Average Temperature by Day and Month"
-    )
-    fig.update_xaxes(side="top")
-    st.plotly_chart(fig, use_container_width=True)
+            # --- Bar Chart: Average Wind Speed vs Temperature by Season ---
+            st.subheader(" Average Wind Speed vs Temperature")
+            fig_bar = px.bar(
+                season_wind_temperature(df),
+                x='season',
+                y='wind_speed_10m_mean_km/h',
+                color='temperature_2m_mean_°C',
+                barmode='group',
+                template='cairo'
+            )
+            st.plotly_chart(fig_bar, use_container_width=True)
 
+    if tab_heat.open:
+        with tab_heat:
+            # ---  Cairo Temperature  ---
 
+            st.subheader("🌡️ Temperature Patterns by Time of Day")
 
-# Add interpretation guide
-st.markdown("""
-**How to read these heatmaps:**
-- 🔥 Warmer temperatures shown in yellow/Orange
-- ❄️ Cooler temperatures shown in blue/purple
-""")
+            temp_cube = temperature_cube(pl_df, lo, hi)
+
+            # Create tabs for different temporal views
+            tab1, tab2 = st.tabs(["By Hour of Day", "By Day of Week"], key='heatmap_view', on_change='rerun')
+
+            if tab1.open:
+                with tab1:
+                    # Hourly heatmap
+                    # Columns start with Monday
+                    days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+                    mat, x, y = temperature_heatmap(temp_cube, lo, hi, 'hour', 'day_of_week_name', days_order)
+                    
+                    fig = px.imshow(
+                        mat,
+                        x=x,
+                        y=y,
+                        labels=dict(x="Day of Week", y="Hour of Day", color="Temperature (°C)"),
+                        color_continuous_scale="thermal",
+                        template='cairo',
+                        title="Average Temperature by Hour and Day"
+                    )
+                    fig.update_xaxes(side="top")
+                    st.plotly_chart(fig, use_container_width=True)
+
+            if tab2.open:
+                with tab2:
+                    # Daily heatmap
+                    # Columns in calendar order
+                    months_order = ['January', 'February', 'March', 'April', 'May', 'June', 
+                                   'July', 'August', 'September', 'October', 'November', 'December']
+                    mat, x, y = temperature_heatmap(temp_cube, lo, hi, 'day_of_week_name', 'month_name',
+                                                    months_order)
+                    
+                    fig = px.imshow(
+                        mat,
+                        x=x,
+                        y=y,
+                        labels=dict(x="Month", y="Day of Week", color="Temperature (°C)"),
+                        color_continuous_scale="thermal",
+                        template='cairo',
+                        title="Average Temperature by Day and Month"
+                    )
+                    fig.update_xaxes(side="top")
+                    st.plotly_chart(fig, use_container_width=True)
+
+            # Add interpretation guide
+            st.markdown("""
+            **How to read these heatmaps:**
+            - 🔥 Warmer temperatures shown in yellow/Orange
+            - ❄️ Cooler temperatures shown in blue/purple
+            """)
+
+dashboard_sections(df, df_filtered, pl_df, lo, hi, selected_metric)
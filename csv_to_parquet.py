@@ -0,0 +1,13 @@
+import polars as pl
+
+# --- One-time conversion of the raw CSV to Parquet ---
+df = pl.read_csv("Cairo-Weather-clean (1).csv", try_parse_dates=True)
+
+# The CSV stores dates as m/d/Y, which try_parse_dates leaves as strings
+if df.schema['time'] == pl.String:
+    df = df.with_columns(pl.col('time').str.to_datetime('%m/%d/%Y'))
+
+# Drop columns that are entirely empty
+df = df.select([s.name for s in df if s.null_count() < df.height])
+
+df.write_parquet("cairo.parquet", compression="zstd")